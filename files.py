@@ -1,5 +1,6 @@
 import numpy as np
 import h5py as h5
+from multiprocessing import Pool
 
 def datamerge(h5g, *items, merge=True):
     items = list(items)
@@ -26,8 +27,8 @@ def datamerge(h5g, *items, merge=True):
     return dta
 
 
-def dataread(f, *args, merge=True):
-    if type(args[len(args)-1]) is not list:
+def _datakeys(f, args):
+    if not args or type(args[-1]) is not list:
         args = (*args, [0, 9999])
     g = f
     for arg in range(0, len(args)-1):
@@ -39,4 +40,37 @@ def dataread(f, *args, merge=True):
             break
         if int(k) >= lim[0]:
             gr.append(k)
-    return datamerge(g, *gr, merge=merge)
+    return g.name, gr
+
+
+def dataread(f, *args, merge=True):
+    g, gr = _datakeys(f, args)
+    return datamerge(f[g], *gr, merge=merge)
+
+
+def _chunkread(reduction, filename, group, keys):
+    with h5.File(filename, "r") as f:
+        return reduction(datamerge(f[group], *keys))
+
+
+def batchread(reduction, filenames, *args, chunk=1, processes=None):
+    """Apply reduction to chunks of recorded data in a process pool.
+
+    Every file in filenames is split into chunks of at most chunk groups
+    selected the same way as in dataread. Workers open the files
+    themselves and only the return value of reduction is sent back, so it
+    must be a picklable (module level) function. Results are returned as
+    a list ordered by file and then by time.
+    """
+    if chunk < 1:
+        raise ValueError("chunk must be at least 1, got " + str(chunk))
+    if isinstance(filenames, str):
+        filenames = [filenames]
+    tasks = list()
+    for filename in filenames:
+        with h5.File(filename, "r") as f:
+            group, keys = _datakeys(f, args)
+        for i in range(0, len(keys), chunk):
+            tasks.append((reduction, filename, group, keys[i:i+chunk]))
+    with Pool(processes) as pool:
+        return pool.starmap(_chunkread, tasks)
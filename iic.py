@@ -34,20 +34,26 @@ class IIC():
         return data
 
     def write_register(self, register : Register, data : int):
-        self._write_register(register._addr, data)
+        self._write_register(register._iaddr, data)
 
     def read_register(self, register : Register) -> int:
-        return self._read_register(register._addr)
+        return self._read_register(register._iaddr)
 
-    def block_read(self, offset : Register, length : int) -> bytes:
+    def read_register_addr(self, addr : int) -> int:
+        return self._read_register(addr)
+
+    def read_block_addr(self, addr : int, length : int) -> bytes:
         if length > 32:
-            data_size, data = self._block_read2(offset._addr, length)
+            data_size, data = self._block_read2(addr, length)
         else:
-            data_size, data = self._block_read(offset._addr, length)
+            data_size, data = self._block_read(addr, length)
         if data_size < 0:
             raise OSError('Error ' + str(data_size) + ': unable to read i2c block data')
         return data
 
+    def block_read(self, offset : Register, length : int) -> bytes:
+        return self.read_block_addr(offset._iaddr, length)
+
     def _set_flag(self, register : int, flag : int):
         self._write_register(register, self._read_register(register) | flag)
 
@@ -56,11 +62,17 @@ class IIC():
 
     def set_flag(self, regorflag, flag : int = None):
         if flag is None: flag = regorflag
-        self._set_flag(regorflag._addr, flag)
+        self._set_flag(regorflag._iaddr, int(flag))
 
     def unset_flag(self, regorflag, flag : int = None):
         if flag is None: flag = regorflag
-        self._unset_flag(regorflag._addr, flag)
+        self._unset_flag(regorflag._iaddr, int(flag))
+
+    def set_flag_addr(self, addr : int, flag : int):
+        self._set_flag(addr, flag)
+
+    def unset_flag_addr(self, addr : int, flag : int):
+        self._unset_flag(addr, flag)
 
     @staticmethod
     def check_flag(bitfield : int, flag : int) -> bool:
@@ -69,7 +81,7 @@ class IIC():
         return (bitfield & flag) != 0
 
     def read_flag(self, flag : Flag) -> bool:
-        return self.check_flag(self.read_register(flag._addr), flag)
+        return self.check_flag(self._read_register(flag._iaddr), int(flag))
     
     def close(self):
         self.pi.i2c_close(self.iic)
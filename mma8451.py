@@ -12,13 +12,20 @@ from multiprocessing import Queue, Process
 from queue import Empty
 import time
 
-# External libraries
-import pigpio
-import numpy as np
+# External libraries are imported on first use so that importing this
+# module, e.g. to only configure a device, does not pay for loading them
+def _numpy():
+    import numpy
+    return numpy
+
+
+def _pigpio():
+    import pigpio
+    return pigpio
 
 
 class DataProcessor(Process):
-    DataQueue = Queue()
+    DataQueue = None
 
     def __init__(self, bit_depth, n, vrange, callback,
                  convert_to_float=True, **kwargs):
@@ -39,6 +46,7 @@ class DataProcessor(Process):
         return num
 
     def prepare_data(self, bitvec):
+        np = _numpy()
         data = np.zeros(
             [len(bitvec)//6, 3],
             dtype=np.float64 if self.convert_to_float else np.int16)
@@ -49,6 +57,7 @@ class DataProcessor(Process):
         return data
 
     def run(self):
+        np = _numpy()
         data = None
         while True:
             try:
@@ -72,6 +81,7 @@ class ThreadedDataReader(Thread):
     def __init__(self, iic, bit_depth, **kwargs):
         self.f_run = True
         self.bit_depth = bit_depth
+        self.sample_size = 3*round(bit_depth/8)
         self.iic = iic
         super().__init__(**kwargs)
 
@@ -83,15 +93,21 @@ class ThreadedDataReader(Thread):
         self.f_run = False
 
     def run(self):
-        while ThreadedDataReader.InterruptSF.acquire(timeout=1) and self.f_run:
-            status = self.iic.read_register(REG.F_STATUS)
-            f_cnt = status & REG.F_STATUS.F_CNT
+        # Resolve everything up front, the loop only does integer work
+        interrupt = ThreadedDataReader.InterruptSF
+        queue = DataProcessor.DataQueue
+        read_register = self.iic.read_register_addr
+        read_block = self.iic.read_block_addr
+        f_status = int(REG.F_STATUS)
+        f_cnt_mask = int(REG.F_STATUS.F_CNT)
+        out_x_msb = int(REG.OUT_X_MSB)
+        sample_size = self.sample_size
+        while interrupt.acquire(timeout=1) and self.f_run:
+            f_cnt = read_register(f_status) & f_cnt_mask
             if f_cnt == 32:
                 print("Warning: FIFO buffer overflow!")
-            DataProcessor.DataQueue.put(
-                self.iic.block_read(REG.OUT_X_MSB,
-                                    f_cnt*3*round(self.bit_depth/8)))
-            self.iic.read_register(REG.F_STATUS)
+            queue.put(read_block(out_x_msb, f_cnt*sample_size))
+            read_register(f_status)
         print("ThreadedDataReader exiting...")
 
 
@@ -105,7 +121,7 @@ class Device():
         self.open()
 
     def open(self):
-        self.pi = pigpio.pi()
+        self.pi = _pigpio().pi()
         if not self.pi.connected:
             raise OSError("Error connecting to pigpio daemon")
         iic_dev = 1 if self.pi.get_hardware_revision() > 1 else 0
@@ -127,11 +143,11 @@ class Device():
         for option in settings.keys():
             setting = settings[option]
             if option == "bit_depth":
-                self.iic.unset_flag(
-                    *Configuration.get_unset_params(option))
+                self.iic.unset_flag_addr(
+                    *Configuration._compiled_unset_params(option))
             else:
-                self.iic.set_flag(
-                    *Configuration.get_set_params(option, setting))
+                self.iic.set_flag_addr(
+                    *Configuration._compiled_set_params(option, setting))
         self.conf.update(**settings)
 
         self.iic.set_flag(REG.CTRL_REG1.ACTIVE)
@@ -140,6 +156,7 @@ class Device():
                                      interrupt_pin=2,
                                      time_interval=60,
                                      convert_to_float=True):
+        pigpio = _pigpio()
 
         self.iic.unset_flag(REG.CTRL_REG1.ACTIVE)
 
@@ -155,6 +172,9 @@ class Device():
         self.pi.callback(gpio_pin, pigpio.FALLING_EDGE,
                          ThreadedDataReader.callback)
 
+        if DataProcessor.DataQueue is None:
+            DataProcessor.DataQueue = Queue()
+
         self.thr_dr = ThreadedDataReader(iic=self.iic,
                                          bit_depth=self.conf.get("bit_depth"))
 
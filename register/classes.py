@@ -2,11 +2,18 @@ from enum import IntEnum
 
 
 class Register(type(IntEnum)):
+    def __new__(metacls, *args, **kwargs):
+        cls = super().__new__(metacls, *args, **kwargs)
+        # _addr is itself an enum member, resolve it once to a plain int
+        if "_addr" in cls.__members__:
+            cls._iaddr = int(cls.__members__["_addr"])
+        return cls
+
     def __int__(self):
-        return int(self._addr)
+        return self._iaddr
 
     def __repr__(cls):
-        return "<" + cls.__name__ + ": " + str(hex(cls._addr)) + ">"
+        return "<" + cls.__name__ + ": " + str(hex(cls._iaddr)) + ">"
 
 
 class Flag(IntEnum, metaclass=Register):
@@ -116,3 +116,31 @@ class Configuration():
     def get_set_params(option, setting):
         op = Configuration._conf[option]
         return op["register"], op["flags"][setting]
+
+    @staticmethod
+    def _compiled_unset_params(option):
+        return Configuration._unset_table[option]
+
+    @staticmethod
+    def _compiled_set_params(option, setting):
+        return Configuration._set_table[option, setting]
+
+    @staticmethod
+    def _compile(conf):
+        """Flatten conf into integer (address, flag) lookup tables."""
+        unset_table = dict()
+        set_table = dict()
+        for option, op in conf.items():
+            flags = op["flags"]
+            if not isinstance(flags, dict):
+                flags = {flag: flag for flag in flags}
+            addr = int(op["register"])
+            unset_table[option] = \
+                addr, reduce(lambda a, b: a | b, map(int, flags.values()))
+            for setting, flag in flags.items():
+                set_table[option, setting] = addr, int(flag)
+        return unset_table, set_table
+
+
+Configuration._unset_table, Configuration._set_table = \
+    Configuration._compile(Configuration._conf)